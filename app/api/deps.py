@@ -1,18 +1,40 @@
+import threading
+import time
+
+import orjson
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+import jwt
 from sqlalchemy.orm import Session
 from app.core.config import settings
-from app.core.token_blacklist import token_blacklist
+from app.core.token_blacklist import BLACKLIST_KEY_PREFIX, token_blacklist
 from app.database import SessionLocal
-from app.models.user import User as UserModel
-from app.schemas.user import User
+from app.models.user import User as UserModel, UserRole
 from typing import Generator, Optional
 
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/auth/login"
 )
 
+USER_CACHE_KEY_PREFIX = "user_cache:"
+# Cached users live at most as long as the tokens that reference them.
+USER_CACHE_TTL = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+# Decoded-token memo: one signature verification per token instead of
+# per request. Entries are process-local and revalidated against the
+# token's own "exp" claim on every hit, so a cached payload can never
+# outlive the token it came from. TTLCache is not thread-safe and
+# get_current_user runs in the threadpool, so every access holds the
+# lock; the critical section is a dict operation, not the decode.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+_token_cache_lock = threading.Lock()
+
+
+def invalidate_user_cache(email: str) -> None:
+    """Drop the cached user entry after a role or account change."""
+    token_blacklist.redis_client.delete(f"{USER_CACHE_KEY_PREFIX}{email}")
+
 
 def get_db() -> Generator:
     """
@@ -25,12 +47,16 @@ def get_db() -> Generator:
         db.close()
 
 
-async def get_current_user(
+def get_current_user(
     db: Session = Depends(get_db),
     token: str = Depends(oauth2_scheme)
-) -> User:
+) -> UserModel:
     """
     Get current user based on JWT token.
+
+    Declared sync so FastAPI resolves it in the threadpool: the JWT
+    decode, the Redis blacklist check and the user query all block,
+    and must not run on the event loop.
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -38,44 +64,69 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    # Check if token is blacklisted
-    if token_blacklist.is_blacklisted(token):
+    with _token_cache_lock:
+        payload = _token_cache.get(token)
+    if payload is None:
+        try:
+            # Decode JWT token
+            payload = jwt.decode(
+                token,
+                settings.SECRET_KEY,
+                algorithms=[settings.ALGORITHM]
+            )
+        except jwt.PyJWTError:
+            raise credentials_exception
+        with _token_cache_lock:
+            _token_cache[token] = payload
+    elif payload.get("exp", 0) <= time.time():
+        # The memo may outlive the token; enforce expiry on hits.
+        raise credentials_exception
+
+    email: str = payload.get("sub")
+    if email is None:
+        raise credentials_exception
+
+    # Blacklist check and cached-user lookup share one round-trip
+    pipe = token_blacklist.redis_client.pipeline()
+    pipe.exists(f"{BLACKLIST_KEY_PREFIX}{token}")
+    pipe.get(f"{USER_CACHE_KEY_PREFIX}{email}")
+    blacklisted, cached_user = pipe.execute()
+
+    if blacklisted:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has been invalidated",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    try:
-        # Decode JWT token
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
-        )
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
+    if cached_user:
+        # Rebuild a transient ORM instance: downstream code only reads
+        # attributes, and skipping pydantic validation keeps the hit
+        # path to a dict copy.
+        return UserModel(**orjson.loads(cached_user))
 
     # Get user from database
     user = db.query(UserModel).filter(UserModel.email == email).first()
     if user is None:
         raise credentials_exception
 
-    return User(
-        id=user.id,
-        email=user.email,
-        full_name=user.full_name,
-        role=user.role,
-        is_active=user.is_active
+    token_blacklist.redis_client.setex(
+        f"{USER_CACHE_KEY_PREFIX}{email}",
+        USER_CACHE_TTL,
+        orjson.dumps({
+            "id": user.id,
+            "email": user.email,
+            "full_name": user.full_name,
+            "role": UserRole(user.role).value,
+            "is_active": user.is_active,
+        })
     )
+    return user
 
 
-async def get_current_active_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+def get_current_active_user(
+    current_user: UserModel = Depends(get_current_user)
+) -> UserModel:
     """
     Get current active user.
     """
@@ -16,7 +16,7 @@ oauth2_scheme = OAuth2PasswordBearer(
 
 
 @router.post("/register", response_model=User)
-async def register(
+def register(
     *,
     db: Session = Depends(deps.get_db),
     user_in: UserCreate,
@@ -41,7 +41,7 @@ async def register(
 
 
 @router.post("/login", response_model=Token)
-async def login(
+def login(
     db: Session = Depends(deps.get_db),
     form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
@@ -76,7 +76,7 @@ async def login(
 
 
 @router.post("/logout")
-async def logout(
+def logout(
     token: str = Security(oauth2_scheme)
 ) -> dict:
     """Logout user by blacklisting their token"""
@@ -97,7 +97,7 @@ async def test_token(current_user: User = Depends(deps.get_current_user)) -> Any
 
 
 @router.post("/reset-password/{email}")
-async def reset_password(
+def reset_password(
     email: str,
     db: Session = Depends(deps.get_db)
 ) -> Any:
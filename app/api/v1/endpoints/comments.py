@@ -1,10 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session, raiseload
+from typing import List, Optional
 from app.api import deps
 from app.core.permissions import Permission, require_permission, check_permission
 from app.models.user import User, UserRole
-from app.schemas.comment import Comment, CommentCreate, CommentUpdate
+from app.schemas.comment import Comment, CommentCreate, CommentUpdate, CommentPage
 from app.models.comment import Comment as CommentModel
 from app.models.post import Post as PostModel
 
@@ -13,17 +13,20 @@ router = APIRouter()
 
 @router.post("/", response_model=Comment)
 @require_permission(Permission.CREATE_COMMENT)
-async def create_comment(
+def create_comment(
     *,
     db: Session = Depends(deps.get_db),
     comment_in: CommentCreate,
     current_user: User = Depends(deps.get_current_user)
 ) -> Comment:
     """Create a new comment on a post."""
-    # Check if post exists
-    post = db.query(PostModel).filter(
-        PostModel.id == comment_in.post_id).first()
-    if not post:
+    # Check if post exists; EXISTS lets the database answer from the
+    # primary-key index without loading the row.
+    post_exists = db.query(
+        db.query(PostModel).filter(
+            PostModel.id == comment_in.post_id).exists()
+    ).scalar()
+    if not post_exists:
         raise HTTPException(status_code=404, detail="Post not found")
 
     comment = CommentModel(
@@ -38,7 +41,7 @@ async def create_comment(
 
 
 @router.get("/{comment_id}", response_model=Comment)
-async def get_comment(
+def get_comment(
     comment_id: int,
     db: Session = Depends(deps.get_db)
 ) -> Comment:
@@ -49,30 +52,43 @@ async def get_comment(
     return comment
 
 
-@router.get("/post/{post_id}", response_model=List[Comment])
-async def get_comments_by_post(
+@router.get("/post/{post_id}", response_model=CommentPage)
+def get_comments_by_post(
     post_id: int,
     db: Session = Depends(deps.get_db),
-    skip: int = 0,
+    after_id: Optional[int] = Query(None, ge=1),
     limit: int = 10
-) -> List[Comment]:
-    """Get all comments for a specific post."""
+) -> CommentPage:
+    """
+    Get all comments for a specific post.
+
+    Keyset-paginated oldest-first: pass the previous page's
+    next_cursor as after_id and the scan seeks straight to that index
+    entry instead of discarding OFFSET rows.
+    """
     # Check if post exists
-    post = db.query(PostModel).filter(PostModel.id == post_id).first()
-    if not post:
+    post_exists = db.query(
+        db.query(PostModel).filter(PostModel.id == post_id).exists()
+    ).scalar()
+    if not post_exists:
         raise HTTPException(status_code=404, detail="Post not found")
 
-    comments = db.query(CommentModel)\
-        .filter(CommentModel.post_id == post_id)\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
-    return comments
+    # Comments serialize no relationships; raiseload guards against a
+    # lazy load creeping into the list path unnoticed.
+    query = db.query(CommentModel)\
+        .options(raiseload("*"))\
+        .filter(CommentModel.post_id == post_id)
+    if after_id is not None:
+        query = query.filter(CommentModel.id > after_id)
+
+    comments = query.order_by(CommentModel.id.asc()).limit(limit).all()
+    next_cursor = comments[-1].id if len(comments) == limit else None
+    return {"items": comments, "next_cursor": next_cursor}
 
 
 @router.put("/{comment_id}", response_model=Comment)
 @require_permission(Permission.EDIT_COMMENT)
-async def update_comment(
+def update_comment(
     *,
     db: Session = Depends(deps.get_db),
     comment_id: int,
@@ -93,7 +109,6 @@ async def update_comment(
         )
 
     comment.content = comment_in.content
-    db.add(comment)
     db.commit()
     db.refresh(comment)
     return comment
@@ -101,7 +116,7 @@ async def update_comment(
 
 @router.delete("/{comment_id}")
 @require_permission(Permission.DELETE_COMMENT)
-async def delete_comment(
+def delete_comment(
     *,
     db: Session = Depends(deps.get_db),
     comment_id: int,
@@ -1,34 +1,57 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy import func
+from sqlalchemy.orm import Session, raiseload, selectinload
+from typing import List, Optional
 from app.api import deps
 from app.core.permissions import Permission, require_permission
-from app.core.cache import cached
+from app.core.cache import cached, cached_count, invalidate_namespace
 from app.schemas.user import User
-from app.schemas.post import Post, PostCreate, PostUpdate, PostFilter
+from app.schemas.post import Post, PostCreate, PostUpdate, PostFilter, PostPage
 from app.models.post import Post as PostModel, Tag as TagModel
 
 
 router = APIRouter()
 
+# How long a filtered listing's COUNT(*) may be served stale
+COUNT_CACHE_TTL = 30
+
+
+def _resolve_tags(db: Session, tag_names: List[str]) -> List[TagModel]:
+    """
+    Fetch existing tags in a single IN query and create the missing
+    ones, instead of one SELECT round-trip per tag name.
+    """
+    if not tag_names:
+        return []
+    existing = {
+        tag.name: tag
+        for tag in db.query(TagModel).filter(
+            TagModel.name.in_(tag_names)).all()
+    }
+    tags = []
+    new_tags = []
+    for tag_name in tag_names:
+        tag = existing.get(tag_name)
+        if not tag:
+            tag = TagModel(name=tag_name)
+            existing[tag_name] = tag
+            new_tags.append(tag)
+        tags.append(tag)
+    if new_tags:
+        db.add_all(new_tags)
+    return tags
+
 
 @router.post("/", response_model=Post)
 @require_permission(Permission.CREATE_POST)
-async def create_post(
+def create_post(
     *,
     post_in: PostCreate,
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_user)
 ) -> Post:
     """Create a new blog post."""
-    # Process tags
-    tags = []
-    for tag_name in post_in.tags:
-        tag = db.query(TagModel).filter(TagModel.name == tag_name).first()
-        if not tag:
-            tag = TagModel(name=tag_name)
-            db.add(tag)
-        tags.append(tag)
+    tags = _resolve_tags(db, post_in.tags)
 
     post = PostModel(
         title=post_in.title,
@@ -39,12 +62,13 @@ async def create_post(
     db.add(post)
     db.commit()
     db.refresh(post)
+    invalidate_namespace("post_list")
     return post
 
 
 @router.get("/{post_id}", response_model=Post)
 @cached(expire=300, namespace="post_detail")  # Cache for 5 minutes
-async def get_post(
+def get_post(
     post_id: int,
     db: Session = Depends(deps.get_db)
 ) -> Post:
@@ -55,42 +79,88 @@ async def get_post(
     return post
 
 
-@router.get("/", response_model=List[Post])
+@router.get("/", response_model=PostPage)
 @cached(expire=60, namespace="post_list")  # Cache for 1 minute
 def get_posts(
     db: Session = Depends(deps.get_db),
-    skip: int = 0,
+    after_id: Optional[int] = Query(None, ge=1),
     limit: int = 10,
     filter_params: PostFilter = Depends()
-) -> List[Post]:
-    """Get all posts with optional filtering."""
-    query = db.query(PostModel)
+) -> PostPage:
+    """
+    Get all posts with optional filtering.
+
+    Pages are keyset-based: pass the previous page's next_cursor as
+    after_id. Unlike OFFSET, the scan starts at the cursor's index
+    entry no matter how deep the page is, and concurrent inserts can't
+    shift rows across page boundaries.
+    """
+    filters = []
 
     if filter_params.keyword:
-        query = query.filter(
-            (PostModel.title.ilike(f"%{filter_params.keyword}%")) |
-            (PostModel.content.ilike(f"%{filter_params.keyword}%"))
-        )
+        if db.get_bind().dialect.name == "postgresql":
+            # Index-backed full-text search; the expression matches the
+            # GIN index created in app.database.create_search_index.
+            filters.append(
+                func.to_tsvector(
+                    'english',
+                    PostModel.title + ' ' + PostModel.content
+                ).op('@@')(
+                    func.plainto_tsquery('english', filter_params.keyword)
+                )
+            )
+        else:
+            # Leading-wildcard ILIKE can't use an index; kept only as a
+            # fallback for non-Postgres backends (e.g. sqlite tests).
+            filters.append(
+                (PostModel.title.ilike(f"%{filter_params.keyword}%")) |
+                (PostModel.content.ilike(f"%{filter_params.keyword}%"))
+            )
 
     if filter_params.author_id:
-        query = query.filter(PostModel.author_id == filter_params.author_id)
+        filters.append(PostModel.author_id == filter_params.author_id)
 
     if filter_params.tag:
-        query = query.filter(PostModel.tags.any(
+        filters.append(PostModel.tags.any(
             TagModel.name == filter_params.tag))
 
     if filter_params.start_date:
-        query = query.filter(PostModel.created_at >= filter_params.start_date)
+        filters.append(PostModel.created_at >= filter_params.start_date)
 
     if filter_params.end_date:
-        query = query.filter(PostModel.created_at <= filter_params.end_date)
+        filters.append(PostModel.created_at <= filter_params.end_date)
+
+    # The total depends on the filters but not the cursor, so every
+    # page of the same listing shares one briefly-cached COUNT.
+    total = cached_count(
+        "posts:{}:{}:{}:{}:{}".format(
+            filter_params.keyword, filter_params.author_id,
+            filter_params.tag, filter_params.start_date,
+            filter_params.end_date
+        ),
+        COUNT_CACHE_TTL,
+        lambda: db.query(func.count(PostModel.id)).filter(*filters).scalar()
+    )
 
-    return query.offset(skip).limit(limit).all()
+    # Everything serialization touches is loaded eagerly; raiseload
+    # turns any lazy load that sneaks back into this path into a loud
+    # error instead of a silent N+1.
+    query = db.query(PostModel).options(
+        selectinload(PostModel.tags),
+        raiseload("*")
+    ).filter(*filters)
+
+    if after_id is not None:
+        query = query.filter(PostModel.id < after_id)
+
+    posts = query.order_by(PostModel.id.desc()).limit(limit).all()
+    next_cursor = posts[-1].id if len(posts) == limit else None
+    return {"items": posts, "next_cursor": next_cursor, "total": total}
 
 
 @router.put("/{post_id}", response_model=Post)
 @require_permission(Permission.EDIT_POST)
-async def update_post(
+def update_post(
     *,
     db: Session = Depends(deps.get_db),
     post_id: int,
@@ -104,29 +174,23 @@ async def update_post(
 
     # Update tags if provided
     if post_in.tags is not None:
-        tags = []
-        for tag_name in post_in.tags:
-            tag = db.query(TagModel).filter(TagModel.name == tag_name).first()
-            if not tag:
-                tag = TagModel(name=tag_name)
-                db.add(tag)
-            tags.append(tag)
-        post.tags = tags
+        post.tags = _resolve_tags(db, post_in.tags)
 
     # Update other fields
     for field, value in post_in.model_dump(exclude={'tags'}).items():
         if value is not None:
             setattr(post, field, value)
 
-    db.add(post)
     db.commit()
     db.refresh(post)
+    invalidate_namespace("post_list")
+    invalidate_namespace("post_detail")
     return post
 
 
 @router.delete("/{post_id}")
 @require_permission(Permission.DELETE_POST)
-async def delete_post(
+def delete_post(
     *,
     db: Session = Depends(deps.get_db),
     post_id: int,
@@ -139,4 +203,6 @@ async def delete_post(
 
     db.delete(post)
     db.commit()
+    invalidate_namespace("post_list")
+    invalidate_namespace("post_detail")
     return {"message": "Post deleted successfully"}
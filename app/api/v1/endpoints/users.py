@@ -10,7 +10,7 @@ router = APIRouter()
 
 @router.get("/", response_model=List[User])
 @require_permission(Permission.MANAGE_USERS)
-async def get_users(
+def get_users(
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_user)
 ) -> List[User]:
@@ -19,7 +19,7 @@ async def get_users(
 
 @router.put("/{user_id}/role", response_model=User)
 @require_permission(Permission.MANAGE_USERS)
-async def update_user_role(
+def update_user_role(
     user_id: int,
     new_role: UserRole,
     db: Session = Depends(deps.get_db),
@@ -30,7 +30,7 @@ async def update_user_role(
         raise HTTPException(status_code=404, detail="User not found")
 
     user.role = new_role
-    db.add(user)
     db.commit()
     db.refresh(user)
+    deps.invalidate_user_cache(user.email)
     return user
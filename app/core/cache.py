@@ -1,20 +1,27 @@
+import hashlib
 from typing import Optional
+import orjson
 from fastapi import Depends
 from fastapi_cache import FastAPICache
 from fastapi_cache.backends.redis import RedisBackend
 from fastapi_cache.decorator import cache
+from redis import Redis
 from redis import asyncio as aioredis
 from app.core.config import settings
 
+# Request-scoped objects that must not become cache dimensions
+_KEY_EXCLUDED_KWARGS = frozenset({"self", "cls", "db", "request", "response"})
+
 
 async def setup_cache():
     """Initialize Redis cache"""
+    # No decode_responses here: the backend stores and loads raw
+    # bytes, and fastapi-cache's coder decodes them itself.
     redis = aioredis.Redis(
         host=settings.REDIS_HOST,
         port=settings.REDIS_PORT,
         password=settings.REDIS_PASSWORD,
-        db=settings.REDIS_DB,
-        decode_responses=True
+        db=settings.REDIS_DB
     )
 
     FastAPICache.init(
@@ -24,31 +31,77 @@ async def setup_cache():
     )
 
 
-def cache_key_builder(
-    func,
-    namespace: Optional[str] = None,
-    *args,
-    **kwargs,
-):
-    """Custom cache key builder that includes query parameters"""
-    prefix = FastAPICache.get_prefix()
-    cache_key = f"{prefix}:{namespace}:" if namespace else f"{prefix}:"
+# Sync client for cache invalidation from threadpooled write endpoints
+_invalidation_redis = Redis(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    password=settings.REDIS_PASSWORD,
+    db=settings.REDIS_DB,
+    decode_responses=True
+)
+
 
-    # Add function module and name
-    cache_key += f"{func.__module__}:{func.__name__}:"
+def invalidate_namespace(namespace: str) -> None:
+    """
+    Drop every cached entry in a namespace. Keys are hashed, so
+    invalidation works at namespace granularity; UNLINK keeps the
+    deletion off Redis's main thread.
+    """
+    pattern = f"{FastAPICache.get_prefix()}:{namespace}:*"
+    for key in _invalidation_redis.scan_iter(match=pattern, count=500):
+        _invalidation_redis.unlink(key)
 
-    # Add args if any
-    if args:
-        cache_key += ":".join(str(arg) for arg in args)
 
-    # Add kwargs if any, sorted by key for consistency
-    if kwargs:
-        cache_key += ":".join(
-            f"{k}={v}" for k, v in sorted(kwargs.items())
-            if k not in ["self", "cls"]  # Exclude self and cls
-        )
+def cached_count(key: str, ttl: int, compute) -> int:
+    """
+    Serve a COUNT(*) total from Redis, recomputing at most once per
+    ttl seconds. Counting is the slowest part of a filtered listing at
+    scale, and a slightly stale total is fine for pagination UI.
+    """
+    cache_key = f"count:{key}"
+    cached_value = _invalidation_redis.get(cache_key)
+    if cached_value is not None:
+        return int(cached_value)
+    value = compute()
+    _invalidation_redis.setex(cache_key, ttl, value)
+    return value
 
-    return cache_key
+
+def cache_key_builder(
+    func,
+    namespace: str = "",
+    *,
+    request=None,
+    response=None,
+    args=(),
+    kwargs=None,
+):
+    """Custom cache key builder that includes query parameters"""
+    # The decorator passes the endpoint's own kwargs nested under
+    # `kwargs`, and a namespace that already carries the cache prefix;
+    # filtering or prefixing at the wrong level would hash the per-
+    # request DB session repr into every key (making hits impossible)
+    # and double-prefix keys out of reach of pattern invalidation.
+    #
+    # One C-level hash over a canonical byte buffer instead of building
+    # many small strings per request; keys come out short and
+    # fixed-length. The DB session is excluded — it is request state,
+    # and hashing its repr would make every key unique.
+    payload = orjson.dumps(
+        {
+            "module": func.__module__,
+            "func": func.__name__,
+            "args": args,
+            "kwargs": {
+                k: v for k, v in (kwargs or {}).items()
+                if k not in _KEY_EXCLUDED_KWARGS
+            },
+        },
+        option=orjson.OPT_SORT_KEYS,
+        default=str,
+    )
+    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    return f"{namespace}:{digest}"
 
 
 def cached(
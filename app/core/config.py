@@ -1,9 +1,3 @@
-from typing import Optional
-from fastapi import Depends
-from fastapi_cache import FastAPICache
-from fastapi_cache.backends.redis import RedisBackend
-from fastapi_cache.decorator import cache
-from redis import asyncio as aioredis
 from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from pydantic import PostgresDsn, field_validator
@@ -26,11 +20,20 @@ class Settings(BaseSettings):
 
     SQLALCHEMY_DATABASE_URI: Optional[PostgresDsn] = None
 
+    # Create tables on startup; disable where migrations own the schema
+    AUTO_CREATE_TABLES: bool = True
+
+    # Expose ?profile=1 request profiling; keep off outside diagnosis
+    PROFILING_ENABLED: bool = False
+
     # JWT Configuration
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Password hashing cost factor; lower it in test environments
+    BCRYPT_ROUNDS: int = 12
+
     # Redis Configuration
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
@@ -60,60 +63,3 @@ def get_settings():
 
 
 settings = get_settings()
-
-
-async def setup_cache():
-    """Initialize Redis cache"""
-    redis = aioredis.from_url(
-        f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}",
-        encoding="utf8",
-        decode_responses=True
-    )
-
-    FastAPICache.init(
-        RedisBackend(redis),
-        prefix="fastapi-cache",
-        expire=60 * 5  # Default cache expiration of 5 minutes
-    )
-
-
-def cache_key_builder(
-    func,
-    namespace: Optional[str] = None,
-    *args,
-    **kwargs,
-):
-    """Custom cache key builder that includes query parameters"""
-    prefix = FastAPICache.get_prefix()
-    cache_key = f"{prefix}:{namespace}:" if namespace else f"{prefix}:"
-
-    # Add function module and name
-    cache_key += f"{func.__module__}:{func.__name__}:"
-
-    # Add args if any
-    if args:
-        cache_key += ":".join(str(arg) for arg in args)
-
-    # Add kwargs if any, sorted by key for consistency
-    if kwargs:
-        cache_key += ":".join(
-            f"{k}={v}" for k, v in sorted(kwargs.items())
-            if k not in ["self", "cls"]  # Exclude self and cls
-        )
-
-    return cache_key
-
-
-def cached(
-    expire: Optional[int] = None,
-    namespace: Optional[str] = None,
-    *,
-    skip_existing: bool = False,
-):
-    """Custom cache decorator that uses the custom key builder"""
-    return cache(
-        expire=expire,
-        namespace=namespace,
-        key_builder=cache_key_builder,
-        skip_existing=skip_existing,
-    )
@@ -1,5 +1,6 @@
+import inspect
 from enum import Enum
-from functools import wraps
+from functools import lru_cache, wraps
 from fastapi import HTTPException, status, Depends
 from app.api import deps
 from app.schemas.user import User
@@ -42,6 +43,61 @@ ROLE_PERMISSIONS = {
     ]
 }
 
+# Frozen copies used on the hot path: membership tests become O(1) set
+# lookups instead of scanning the lists above on every request.
+ROLE_PERMISSION_SET = {
+    role: frozenset(permissions)
+    for role, permissions in ROLE_PERMISSIONS.items()
+}
+
+# Permissions whose checks also validate resource ownership.
+OWNERSHIP_PERMISSIONS = frozenset({
+    Permission.EDIT_POST,
+    Permission.DELETE_POST,
+    Permission.EDIT_COMMENT,
+    Permission.DELETE_COMMENT
+})
+
+
+def _build_permission_checkers():
+    """
+    Specialize the permission rules into one tiny predicate per
+    (role, permission) pair. Roles and grants are fixed at import, so
+    the branching happens once here; denied pairs are simply absent
+    from the table.
+    """
+    def _allow(is_owner):
+        return True
+
+    def _owner_only(is_owner):
+        # is_owner is None when no resource is involved.
+        return is_owner is not False
+
+    checkers = {}
+    for role, permissions in ROLE_PERMISSION_SET.items():
+        for permission in permissions:
+            ownership_applies = (
+                role is not UserRole.ADMIN
+                and permission in OWNERSHIP_PERMISSIONS
+            )
+            checkers[(role, permission)] = (
+                _owner_only if ownership_applies else _allow
+            )
+    return checkers
+
+
+PERMISSION_CHECKERS = _build_permission_checkers()
+
+
+@lru_cache(maxsize=None)
+def _allowed(role, permission, is_owner) -> bool:
+    """
+    Pure permission decision; memoized since the argument space is a
+    few dozen combinations, so repeated checks collapse to a cache hit.
+    """
+    checker = PERMISSION_CHECKERS.get((role, permission))
+    return checker(is_owner) if checker else False
+
 
 def check_permission(user: User, permission: Permission, resource_owner_id: int = None) -> bool:
     """
@@ -51,40 +107,64 @@ def check_permission(user: User, permission: Permission, resource_owner_id: int
     if user.is_active == False:
         return False
 
+    # Admins hold every permission and bypass ownership, so the most
+    # common authorization path skips the dispatch table entirely.
+    # == rather than `is`: the role may arrive as the plain stored
+    # string, which compares equal to the str-mixin enum member.
     if user.role == UserRole.ADMIN:
         return True
 
-    if permission not in ROLE_PERMISSIONS[user.role]:
-        return False
+    is_owner = (user.id == resource_owner_id) if resource_owner_id else None
+    return _allowed(user.role, permission, is_owner)
 
-    # Check resource ownership for edit/delete operations
-    if resource_owner_id and permission in [
-        Permission.EDIT_POST,
-        Permission.DELETE_POST,
-        Permission.EDIT_COMMENT,
-        Permission.DELETE_COMMENT
-    ]:
-        return user.id == resource_owner_id
 
-    return True
+def _enforce_permission(permission: Permission, current_user: User, kwargs: dict):
+    resource_owner_id = None
+    if 'post_id' in kwargs:
+        # Reuse the request-scoped session injected into the endpoint:
+        # the post lands in the identity map, so the endpoint's own
+        # lookup becomes a cache hit instead of a second query. Only
+        # open (and properly close) a session of our own when called
+        # outside a request.
+        db = kwargs.get('db')
+        db_gen = None
+        if db is None:
+            db_gen = deps.get_db()
+            db = next(db_gen)
+        try:
+            post = db.query(PostModel).filter(
+                PostModel.id == kwargs['post_id']).first()
+        finally:
+            if db_gen is not None:
+                db_gen.close()
+        if post:
+            resource_owner_id = post.author_id
+    if not check_permission(current_user, permission, resource_owner_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"User does not have permission: {permission}"
+        )
 
 
+@lru_cache(maxsize=None)
 def require_permission(permission: Permission):
+    """
+    Memoized so repeated decorations with the same permission share one
+    decorator object instead of rebuilding the closure each time.
+    """
     def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, current_user: User = Depends(deps.get_current_user), **kwargs):
-            resource_owner_id = None
-            if 'post_id' in kwargs:
-                db = next(deps.get_db())
-                post = db.query(PostModel).filter(
-                    PostModel.id == kwargs['post_id']).first()
-                if post:
-                    resource_owner_id = post.author_id
-            if not check_permission(current_user, permission, resource_owner_id):
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"User does not have permission: {permission}"
-                )
-            return await func(*args, current_user=current_user, **kwargs)
+        # Preserve the wrapped function's sync/async nature so FastAPI
+        # keeps running sync endpoints in the threadpool instead of
+        # blocking the event loop through an async wrapper.
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, current_user: User = Depends(deps.get_current_user), **kwargs):
+                _enforce_permission(permission, current_user, kwargs)
+                return await func(*args, current_user=current_user, **kwargs)
+        else:
+            @wraps(func)
+            def wrapper(*args, current_user: User = Depends(deps.get_current_user), **kwargs):
+                _enforce_permission(permission, current_user, kwargs)
+                return func(*args, current_user=current_user, **kwargs)
         return wrapper
     return decorator
@@ -1,12 +1,21 @@
 from datetime import datetime, timedelta
 from datetime import timezone
 from typing import Any, Dict, Optional, Union
-from jose import jwt
+import jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 from app.core.token_blacklist import token_blacklist
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Resolved once at import so token calls don't go through pydantic's
+# settings attribute machinery on every encode/decode.
+_SECRET_KEY = settings.SECRET_KEY
+_ALGORITHM = settings.ALGORITHM
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
 
 
 def create_access_token(
@@ -47,8 +56,8 @@ def create_access_token(
     # Create token
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM
+        _SECRET_KEY,
+        algorithm=_ALGORITHM
     )
 
     return encoded_jwt
@@ -65,17 +74,17 @@ def verify_token(token: str) -> Dict[str, Any]:
         Dict containing token claims
 
     Raises:
-        JWTError: If token is invalid
+        PyJWTError: If token is invalid
     """
     # Check if token is blacklisted
     if token_blacklist.is_blacklisted(token):
-        raise jwt.JWTError("Token has been invalidated")
+        raise jwt.InvalidTokenError("Token has been invalidated")
 
     # Decode and verify token
     payload = jwt.decode(
         token,
-        settings.SECRET_KEY,
-        algorithms=[settings.ALGORITHM]
+        _SECRET_KEY,
+        algorithms=[_ALGORITHM]
     )
 
     return payload
@@ -146,5 +155,5 @@ def is_token_valid(token: str) -> bool:
             return False
         verify_token(token)
         return True
-    except (jwt.JWTError, ValueError):
+    except (jwt.PyJWTError, ValueError):
         return False
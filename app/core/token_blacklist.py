@@ -1,46 +1,60 @@
-from redis import Redis
-from jose import jwt
-from datetime import datetime
+import time
+
+from redis import ConnectionPool, Redis
+import jwt
 from app.core.config import settings
 
+BLACKLIST_KEY_PREFIX = "blacklist_token:"
+
+# Shared connection pool so every blacklist check reuses warm
+# connections instead of paying a TCP handshake under load.
+redis_pool = ConnectionPool(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    db=0,
+    max_connections=50,
+    decode_responses=True
+)
+
 
 class TokenBlacklist:
     def __init__(self):
-        self.redis_client = Redis(
-            host=settings.REDIS_HOST,
-            port=settings.REDIS_PORT,
-            db=0,
-            decode_responses=True
-        )
+        self.redis_client = Redis(connection_pool=redis_pool)
 
     def blacklist_token(self, token: str) -> None:
         """Add a token to the blacklist"""
         try:
-            # Decode token to get expiration time
+            # Full verification: logout hands us the raw bearer token
+            # without authenticating first, so an unverified decode
+            # would let anyone write blacklist keys with a forged exp.
             payload = jwt.decode(
                 token,
                 settings.SECRET_KEY,
                 algorithms=[settings.ALGORITHM]
             )
-
-            # Calculate TTL (time until token expires)
-            exp_timestamp = payload['exp']
-            current_timestamp = datetime.utcnow().timestamp()
-            ttl = int(exp_timestamp - current_timestamp)
-
-            if ttl > 0:
-                # Store in Redis with automatic expiration
-                self.redis_client.setex(
-                    f"blacklist_token:{token}",
-                    ttl,
-                    "1"
-                )
-        except jwt.JWTError:
+        except jwt.PyJWTError:
             raise ValueError("Invalid token")
 
+        # Keep the key only until the token expires; clamp to the
+        # configured lifetime so no single entry can outlive the
+        # longest-lived token we issue, and fall back to it if a
+        # (necessarily self-signed) token carries no exp claim.
+        max_ttl = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        exp = payload.get("exp")
+        ttl = max_ttl if exp is None else min(
+            int(exp - time.time()), max_ttl)
+
+        if ttl > 0:
+            # Store in Redis with automatic expiration
+            self.redis_client.setex(
+                f"{BLACKLIST_KEY_PREFIX}{token}",
+                ttl,
+                "1"
+            )
+
     def is_blacklisted(self, token: str) -> bool:
         """Check if a token is blacklisted"""
-        return self.redis_client.exists(f"blacklist_token:{token}")
+        return self.redis_client.exists(f"{BLACKLIST_KEY_PREFIX}{token}")
 
 
 # Create a singleton instance
@@ -1,71 +1,100 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.api.api import api_router
 from app.core.config import settings
-from app.database import Base, engine
+from app.database import Base, create_search_index, engine
 from app.core.cache import setup_cache
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from contextlib import asynccontextmanager
+import asyncio
+from app.middleware.profiling import ProfilingMiddleware
 from app.services.metrics import MetricsService, MetricsMiddleware
 
 
 metrics_service = MetricsService()
-limiter = Limiter(key_func=get_remote_address)
-# Create database tables
-Base.metadata.create_all(bind=engine)
+# Explicit in-process storage with a moving window: per-route checks
+# stay a local counter update, with no middleware-wide interception.
+# Multi-worker deployments should point storage_uri at Redis instead.
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri="memory://",
+    strategy="moving-window"
+)
+
+
+def _create_schema() -> None:
+    """Create database tables and supporting indexes"""
+    Base.metadata.create_all(bind=engine)
+    create_search_index(engine)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize cache on startup"""
+    """Create the schema (when enabled) and initialize cache on startup"""
+    if settings.AUTO_CREATE_TABLES:
+        # The DDL is synchronous; run it in the threadpool so it does
+        # not block the event loop during startup.
+        await asyncio.get_running_loop().run_in_executor(
+            None, _create_schema)
     await setup_cache()
     yield
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 app.add_middleware(MetricsMiddleware, metrics_service=metrics_service)
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
 
-# Set up CORS middleware
-if settings.BACKEND_CORS_ORIGINS:
+# Set up CORS middleware. Explicit method/header lists let Starlette
+# answer preflights from precomputed sets instead of taking the
+# wildcard matching path on every request.
+_CORS_ORIGINS = tuple(str(origin) for origin in settings.BACKEND_CORS_ORIGINS)
+
+if _CORS_ORIGINS:
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=[str(origin)
-                       for origin in settings.BACKEND_CORS_ORIGINS],
+        allow_origins=_CORS_ORIGINS,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=("GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"),
+        allow_headers=("Authorization", "Content-Type", "Accept"),
     )
 
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+# Constant payloads for the probe endpoints, built once instead of on
+# every request.
+_ROOT_RESPONSE = {
+    "message": "Welcome to the Blog Platform API",
+    "version": "1.0.0",
+    "documentation": "/docs",
+    "openapi": f"{settings.API_V1_STR}/openapi.json"
+}
+_HEALTH_RESPONSE = {
+    "status": "healthy",
+    "api_version": "1.0.0"
+}
+
 
 @app.get("/")
 def root():
     """Root endpoint that returns basic API information."""
-    return {
-        "message": "Welcome to the Blog Platform API",
-        "version": "1.0.0",
-        "documentation": f"/docs",
-        "openapi": f"{settings.API_V1_STR}/openapi.json"
-    }
+    return _ROOT_RESPONSE
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint, includes detailed metrics"""
-    return {
-        "status": "healthy",
-        "api_version": "1.0.0",
-        "metrics": metrics_service.get_metrics()
-    }
+    return {**_HEALTH_RESPONSE, "metrics": metrics_service.get_metrics()}
 
 
 if __name__ == "__main__":
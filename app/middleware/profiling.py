@@ -0,0 +1,45 @@
+from pyinstrument import Profiler
+
+
+class ProfilingMiddleware:
+    """
+    On-demand request profiling: append ?profile=1 to any URL to get a
+    pyinstrument flame page instead of the normal response. Pure ASGI,
+    so unprofiled requests pay a single query-string check.
+
+    Registered only when settings.PROFILING_ENABLED is set; do not
+    enable on an internet-facing deployment, as profiles expose
+    internals and add overhead while running.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (scope["type"] != "http"
+                or b"profile=1" not in scope.get("query_string", b"")):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = Profiler(async_mode="enabled")
+        profiler.start()
+
+        async def discard(message):
+            # The profile page replaces the endpoint's own response.
+            pass
+
+        try:
+            await self.app(scope, receive, discard)
+        finally:
+            profiler.stop()
+
+        body = profiler.output_html().encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"text/html; charset=utf-8"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
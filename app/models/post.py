@@ -1,11 +1,13 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Table
+from sqlalchemy import Column, Index, Integer, String, DateTime, ForeignKey, Table
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from app.database import Base
-from datetime import datetime
 
 post_tags = Table('post_tags', Base.metadata,
                   Column('post_id', Integer, ForeignKey('posts.id')),
-                  Column('tag_id', Integer, ForeignKey('tags.id'))
+                  Column('tag_id', Integer, ForeignKey('tags.id')),
+                  # Tag-filtered post queries enter from the tag side.
+                  Index('ix_post_tags_tag_post', 'tag_id', 'post_id')
                   )
 
 
@@ -15,14 +17,27 @@ class Post(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
     content = Column(String)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow,
-                        onupdate=datetime.utcnow)
+    # Server-side defaults: the database fills the clock values, saving
+    # a Python datetime allocation and a bind parameter per insert and
+    # keeping timestamps on a single clock.
+    created_at = Column(DateTime(timezone=True), server_default=func.now(),
+                        nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(),
+                        onupdate=func.now(), nullable=False)
     author_id = Column(Integer, ForeignKey("users.id"))
 
+    # Author + date-range filters are a common combination; a composite
+    # index turns them into one range scan.
+    __table_args__ = (
+        Index("ix_posts_author_created", "author_id", "created_at"),
+    )
+
     author = relationship("User", back_populates="posts")
     comments = relationship("Comment", back_populates="post")
-    tags = relationship("Tag", secondary=post_tags, back_populates="posts")
+    # Tags are serialized with every post; selectin batches them into
+    # one IN query per result set instead of one lazy load per row.
+    tags = relationship("Tag", secondary=post_tags, back_populates="posts",
+                        lazy="selectin")
 
 
 class Tag(Base):
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Integer, String, Enum
+from sqlalchemy import Boolean, Column, Integer, String
 from sqlalchemy.orm import relationship
 from app.database import Base
 import enum
@@ -17,7 +17,11 @@ class User(Base):
     email = Column(String, unique=True, index=True)
     hashed_password = Column(String)
     full_name = Column(String)
-    role = Column(Enum(UserRole), default=UserRole.READER)
+    # Stored as a plain varchar: UserRole is a str enum, so comparisons
+    # and permission-table lookups accept either form, and reads skip
+    # the per-row enum coercion the Enum type performs.
+    role = Column(String(16), default=UserRole.READER.value,
+                  nullable=False, index=True)
     is_active = Column(Boolean, default=True)
 
     posts = relationship("Post", back_populates="author")
@@ -1,4 +1,5 @@
 from pydantic import ConfigDict, BaseModel, field_validator
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -8,11 +9,14 @@ class CommentBase(BaseModel):
 
 class CommentCreate(CommentBase):
     post_id: int
-    content: str
+
+    # Stripping happens in pydantic-core before the validator runs, so
+    # the emptiness check needs no Python-side strip() per request.
+    model_config = ConfigDict(str_strip_whitespace=True)
 
     @field_validator('content')
     def content_must_not_be_empty(cls, v):
-        if not v.strip():
+        if not v:
             raise ValueError('Content must not be empty')
         return v
 
@@ -27,3 +31,9 @@ class Comment(CommentBase):
     author_id: int
     created_at: datetime
     model_config = ConfigDict(from_attributes=True)
+
+
+class CommentPage(BaseModel):
+    """One keyset-paginated page; pass next_cursor back as after_id."""
+    items: List[Comment] = []
+    next_cursor: Optional[int] = None
@@ -19,19 +19,19 @@ class PostBase(BaseModel):
 
 
 class PostCreate(PostBase):
-    title: str
-    content: str
-    tags: List[str] = []
+    # Stripping happens in pydantic-core before the validators run, so
+    # the emptiness checks need no Python-side strip() per request.
+    model_config = ConfigDict(str_strip_whitespace=True)
 
     @field_validator('title')
     def title_must_not_be_empty(cls, v):
-        if not v.strip():
+        if not v:
             raise ValueError('Title must not be empty')
         return v
 
     @field_validator('content')
     def content_must_not_be_empty(cls, v):
-        if not v.strip():
+        if not v:
             raise ValueError('Content must not be empty')
         return v
 
@@ -49,6 +49,14 @@ class Post(PostBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class PostPage(BaseModel):
+    """One keyset-paginated page; pass next_cursor back as after_id."""
+    items: List[Post] = []
+    next_cursor: Optional[int] = None
+    # Count of all rows matching the filters; may be briefly stale
+    total: int = 0
+
+
 class PostFilter(BaseModel):
     keyword: Optional[str] = None
     author_id: Optional[int] = None
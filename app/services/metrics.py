@@ -1,10 +1,10 @@
 import time
 import statistics
+from bisect import bisect_left
 from collections import deque
 from typing import Deque
-from fastapi import FastAPI, Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from datetime import datetime, timedelta
+from fastapi import FastAPI
+from datetime import timedelta
 
 
 class MetricsService:
@@ -18,67 +18,97 @@ class MetricsService:
 
     def __init__(self, window_size: int = 3600):  # Default 1 hour window
         self.window_size = window_size
-        self.errors: Deque[dict] = deque(maxlen=window_size)
-        self.requests: Deque[datetime] = deque(maxlen=window_size)
-        self.start_time = datetime.utcnow()
+        # Float epoch seconds and (timestamp, status, path) tuples:
+        # 8-byte floats instead of per-event datetime objects, and both
+        # deques stay time-sorted so get_metrics can bisect.
+        self.errors: Deque[tuple] = deque(maxlen=window_size)
+        self.requests: Deque[float] = deque(maxlen=window_size)
+        self.total_requests = 0
+        self.start_time = time.time()
+        # Memoized get_metrics result; health probes poll faster than
+        # one-second resolution is worth recomputing.
+        self._cache: dict = None
+        self._cache_ts = 0.0
 
     def record_error(self, status_code: int, path: str):
         """Record an error occurrence"""
-        self.errors.append({
-            'timestamp': datetime.utcnow(),
-            'status_code': status_code,
-            'path': path
-        })
+        self.errors.append((time.time(), status_code, path))
 
     def record_request(self):
         """Record a request occurrence"""
-        self.requests.append(datetime.utcnow())
+        now = time.time()
+        self.requests.append(now)
+        self.total_requests += 1
+        # Opportunistically trim events older than the window so the
+        # deque tracks the window even before maxlen kicks in.
+        cutoff = now - self.window_size
+        while self.requests and self.requests[0] < cutoff:
+            self.requests.popleft()
 
     def get_metrics(self) -> dict:
-        """Get current metrics"""
-        now = datetime.utcnow()
-        minute_ago = now - timedelta(minutes=1)
-        hour_ago = now - timedelta(hours=1)
+        """Get current metrics, recomputed at most once per second"""
+        if (time.monotonic() - self._cache_ts < 1.0
+                and self._cache is not None):
+            return self._cache
 
-        recent_errors = [e for e in self.errors if e['timestamp'] > hour_ago]
-        recent_requests = [r for r in self.requests if r > minute_ago]
+        now = time.time()
 
-        error_rate = (len(recent_errors) / len(recent_requests)
-                      * 100) if recent_requests else 0
-        requests_per_minute = len(recent_requests)  # Requests in last minute
+        # One O(n) copy, then O(log n) bisects instead of filtering
+        # both deques element by element.
+        requests = list(self.requests)
+        errors = list(self.errors)
+        recent_request_count = len(requests) - bisect_left(requests, now - 60)
+        recent_errors = len(errors) - bisect_left(errors, (now - 3600,))
+
+        error_rate = (recent_errors / recent_request_count
+                      * 100) if recent_request_count else 0
+        requests_per_minute = recent_request_count  # Requests in last minute
 
         # Calculate uptime
-        uptime_seconds = (now - self.start_time).total_seconds()
+        uptime_seconds = now - self.start_time
 
-        return {
+        self._cache = {
             "errors": {
                 "rate": round(error_rate, 2),
-                "count": len(recent_errors)
+                "count": recent_errors
             },
             "throughput": {
                 "requests_per_minute": round(requests_per_minute, 2),
-                "total_requests": len(self.requests)
+                "total_requests": self.total_requests
             },
             "uptime": {
                 "seconds": int(uptime_seconds),
                 "formatted": str(timedelta(seconds=int(uptime_seconds)))
             }
         }
+        self._cache_ts = time.monotonic()
+        return self._cache
+
 
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware. BaseHTTPMiddleware spawns an anyio task group
+    and builds Request/Response objects for every call; reading the raw
+    scope/message dicts instead keeps this out of the hot path.
+    """
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app: FastAPI, metrics_service: MetricsService):
-        super().__init__(app)
+    def __init__(self, app, metrics_service: MetricsService):
+        self.app = app
         self.metrics_service = metrics_service
 
-    async def dispatch(self, request: Request, call_next):
-        self.metrics_service.record_request()
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        response = await call_next(request)
+        self.metrics_service.record_request()
 
-        # Record errors (status code >= 400)
-        if response.status_code >= 400:
-            self.metrics_service.record_error(
-                response.status_code, request.url.path)
+        async def send_wrapper(message):
+            # Record errors (status code >= 400)
+            if (message["type"] == "http.response.start"
+                    and message["status"] >= 400):
+                self.metrics_service.record_error(
+                    message["status"], scope["path"])
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_wrapper)
@@ -3,13 +3,35 @@ import sys
 import pytest
 import asyncio
 from typing import Generator, Dict
+import fakeredis
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from redis import Redis
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
+
+# Tests manage the sqlite schema themselves; keep app startup from
+# running DDL against the configured (production) database. Must be
+# set before any app module imports settings.
+os.environ.setdefault("AUTO_CREATE_TABLES", "false")
+# Hashing strength is irrelevant to correctness; minimum-cost bcrypt
+# keeps the many login/fixture hashes from dominating suite wallclock.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+# Settings' required fields must resolve without a .env in the
+# checkout; the values only need to parse — the suite swaps the
+# database for sqlite and never issues production tokens.
+os.environ.setdefault("DB_HOST", "127.0.0.1")
+os.environ.setdefault("DB_PORT", "5432")
+os.environ.setdefault("DB_USER", "postgres")
+os.environ.setdefault("DB_PASSWORD", "postgres")
+os.environ.setdefault("DB_NAME", "blogapi")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-not-for-production")
+
 from app.core.token_blacklist import token_blacklist
+from app.core import cache
 from app.core.config import settings
 from app.core import security
+from app.models.post import Post
 from app.models.user import User, UserRole
 from app.database import Base
 from app.api.deps import get_db
@@ -31,21 +53,116 @@ engine = create_engine(
     poolclass=StaticPool  # Use StaticPool for in-memory database
 )
 
-# Create test session
+# pysqlite's default transaction handling breaks SAVEPOINT (it issues
+# implicit commits); take over BEGIN emission as per the SQLAlchemy
+# sqlite dialect docs so the rollback-per-test fixture works.
+
+
+@event.listens_for(engine, "connect")
+def _sqlite_disable_autobegin(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _sqlite_emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+# Create test session. expire_on_commit=False keeps ORM attributes
+# readable after fixture commits instead of expiring everything and
+# re-SELECTing on next access, so fixtures don't need db.refresh().
 TestingSessionLocal = sessionmaker(
-    autocommit=False, autoflush=False, bind=engine)
+    autocommit=False, autoflush=False, bind=engine,
+    expire_on_commit=False)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolate_redis_db():
+    """Give each pytest-xdist worker its own Redis database"""
+    # Response and count caches live in real Redis; without per-worker
+    # databases one worker's cache teardown races another worker's
+    # cache reads. PYTEST_XDIST_WORKER isn't set until after conftest
+    # import, so this has to happen at fixture time: the lifespan cache
+    # client reads settings.REDIS_DB on every startup, and the sync
+    # invalidation client connects lazily from its pool kwargs. Serial
+    # runs land in db 1, away from the default production db 0.
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    db_index = 1 + int(worker[2:] or 0)
+    settings.REDIS_DB = db_index
+    cache._invalidation_redis.connection_pool.connection_kwargs["db"] = (
+        db_index
+    )
+    yield
 
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_redis():
-    """Setup test Redis connection"""
-    # Use database 1 for testing (database 0 is default for production)
-    token_blacklist.redis_client.select(1)
+    """Point the token blacklist at an in-process fake Redis"""
+    # Blacklist and user-cache operations become dict lookups instead
+    # of TCP round-trips, and nothing the tests write can touch the
+    # configured (production) Redis.
+    real_client = token_blacklist.redis_client
+    token_blacklist.redis_client = fakeredis.FakeStrictRedis(
+        decode_responses=True
+    )
+
+    yield
+
+    token_blacklist.redis_client = real_client
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    """Drop cached users between tests so ids don't leak across runs"""
+    yield
+    client = token_blacklist.redis_client
+    for key in client.scan_iter(match="user_cache:*"):
+        client.delete(key)
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Drop cached endpoint responses and counts between tests"""
+    yield
+    client = Redis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=settings.REDIS_DB
+    )
+    for pattern in ("fastapi-cache:*", "count:*"):
+        for key in client.scan_iter(match=pattern):
+            client.delete(key)
+    client.close()
 
+
+@pytest.fixture(autouse=True)
+def query_budget(request):
+    """
+    Enforce @pytest.mark.max_queries(n): counts every SQL statement the
+    test issues and fails on teardown if the budget is exceeded, so
+    N+1 regressions surface as test failures instead of slow endpoints.
+    """
+    marker = request.node.get_closest_marker("max_queries")
+    if marker is None:
+        yield
+        return
+
+    session = request.getfixturevalue("db")
+    statements = []
+
+    def track(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    connection = session.connection()
+    event.listen(connection, "before_cursor_execute", track)
     yield
+    event.remove(connection, "before_cursor_execute", track)
 
-    # Cleanup after tests
-    token_blacklist.redis_client.flushdb()
+    budget = marker.args[0]
+    assert len(statements) <= budget, (
+        f"executed {len(statements)} queries, budget is {budget}:\n"
+        + "\n".join(statements)
+    )
 
 
 @pytest.fixture(scope="session")
@@ -56,19 +173,32 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _schema():
+    """Create the test schema once per session"""
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
 @pytest.fixture(scope="function")
 def db() -> Generator[Session, None, None]:
     """Provide test database session"""
-    # Create all tables for each test
-    Base.metadata.create_all(bind=engine)
-
-    session = TestingSessionLocal()
+    # Each test runs inside an outer transaction that is rolled back at
+    # teardown; session commits only release savepoints. This replaces
+    # the per-test create_all/drop_all DDL cycle.
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = TestingSessionLocal(
+        bind=connection,
+        join_transaction_mode="create_savepoint"
+    )
     try:
         yield session
     finally:
         session.close()
-        # Drop all tables after each test
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture(scope="function")
@@ -86,35 +216,50 @@ def client(db: Session) -> Generator[TestClient, None, None]:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(scope="session")
+def password_hashes() -> Dict[str, str]:
+    """
+    One bcrypt hash per unique fixture password for the whole session.
+    The user fixtures below are function-scoped (rows roll back with
+    the test transaction), but the KDF work is identical every time,
+    so hashing per test only burns wallclock.
+    """
+    return {
+        password: security.get_password_hash(password)
+        for password in (
+            "testpass123", "authorpass123",
+            "adminpass", "authorpass", "readerpass"
+        )
+    }
+
+
 @pytest.fixture(scope="function")
-def test_user(db: Session) -> User:
+def test_user(db: Session, password_hashes: Dict[str, str]) -> User:
     """Create a test user"""
     user = User(
         email="test@example.com",
         full_name="Test User",
-        hashed_password=security.get_password_hash("testpass123"),
+        hashed_password=password_hashes["testpass123"],
         role=UserRole.READER,
         is_active=True
     )
     db.add(user)
     db.commit()
-    db.refresh(user)
     return user
 
 
 @pytest.fixture(scope="function")
-def test_author(db: Session) -> User:
+def test_author(db: Session, password_hashes: Dict[str, str]) -> User:
     """Create a test author user"""
     author = User(
         email="author@example.com",
         full_name="Test Author",
-        hashed_password=security.get_password_hash("authorpass123"),
+        hashed_password=password_hashes["authorpass123"],
         role=UserRole.AUTHOR,
         is_active=True
     )
     db.add(author)
     db.commit()
-    db.refresh(author)
     return author
 
 
@@ -153,27 +298,41 @@ def author_client(client: TestClient, test_author: User) -> TestClient:
 
 
 @pytest.fixture(scope="function")
-def test_users(db: Session) -> Dict[str, User]:
+def test_post(db: Session, test_author: User) -> Post:
+    """Create an untagged test post"""
+    post = Post(
+        title="Test Post",
+        content="Test Content",
+        author_id=test_author.id,
+        tags=[]
+    )
+    db.add(post)
+    db.commit()
+    return post
+
+
+@pytest.fixture(scope="function")
+def test_users(db: Session, password_hashes: Dict[str, str]) -> Dict[str, User]:
     """Create test users with different roles"""
     users = {
         "admin": User(
             email="admin@example.com",
             full_name="Admin User",
-            hashed_password=security.get_password_hash("adminpass"),
+            hashed_password=password_hashes["adminpass"],
             role=UserRole.ADMIN,
             is_active=True
         ),
         "author": User(
             email="author2@example.com",
             full_name="Author User",
-            hashed_password=security.get_password_hash("authorpass"),
+            hashed_password=password_hashes["authorpass"],
             role=UserRole.AUTHOR,
             is_active=True
         ),
         "reader": User(
             email="reader@example.com",
             full_name="Reader User",
-            hashed_password=security.get_password_hash("readerpass"),
+            hashed_password=password_hashes["readerpass"],
             role=UserRole.READER,
             is_active=True
         )
@@ -183,7 +342,4 @@ def test_users(db: Session) -> Dict[str, User]:
         db.add(user)
     db.commit()
 
-    for key in users:
-        db.refresh(users[key])
-
     return users
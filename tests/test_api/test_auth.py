@@ -1,6 +1,6 @@
 import pytest
 from fastapi import status
-from jose import jwt
+import jwt
 from datetime import timedelta
 from app.core.config import settings
 from app.models.user import UserRole
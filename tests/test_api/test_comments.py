@@ -2,27 +2,16 @@ import pytest
 from datetime import datetime
 from fastapi import status
 from sqlalchemy.orm import Session
+from app.api.deps import get_current_user
 from app.core.config import settings
+from app.main import app
 from app.models.comment import Comment
 from app.models.post import Post
 from app.models.user import User, UserRole
 
-
-@pytest.fixture
-def test_post(db: Session, test_author: User):
-    """Create a test post"""
-    post = Post(
-        title="Test Post",
-        content="Test Content",
-        author_id=test_author.id,
-        tags=[],
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
-    )
-    db.add(post)
-    db.commit()
-    db.refresh(post)
-    return post
+# One timestamp for all seeded rows; nothing here depends on rows
+# having distinct clock values.
+_NOW = datetime.utcnow()
 
 
 @pytest.fixture
@@ -32,11 +21,10 @@ def test_comment(db: Session, test_post: Post, test_user: User):
         content="Test Comment",
         post_id=test_post.id,
         author_id=test_user.id,
-        created_at=datetime.utcnow()
+        created_at=_NOW
     )
     db.add(comment)
     db.commit()
-    db.refresh(comment)
     return comment
 
 
@@ -92,6 +80,7 @@ def test_create_comment_non_existent_post(authorized_client):
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+@pytest.mark.max_queries(25)
 def test_get_comments_by_post(client, test_post, test_comment):
     """Test getting all comments for a specific post"""
     response = client.get(
@@ -99,7 +88,7 @@ def test_get_comments_by_post(client, test_post, test_comment):
     )
 
     assert response.status_code == status.HTTP_200_OK
-    data = response.json()
+    data = response.json()["items"]
     assert isinstance(data, list)
     assert len(data) > 0
     assert data[0]["content"] == test_comment.content
@@ -107,31 +96,45 @@ def test_get_comments_by_post(client, test_post, test_comment):
     assert "created_at" in data[0]
 
 
-def test_get_comments_pagination(client, db, test_post, test_user):
-    """Test comment pagination"""
-    # Create multiple comments
-    for i in range(15):
-        comment = Comment(
-            content=f"Test Comment {i}",
-            post_id=test_post.id,
-            author_id=test_user.id,
-            created_at=datetime.utcnow()
-        )
-        db.add(comment)
+@pytest.fixture
+def many_comments(db: Session, test_post: Post, test_user: User):
+    """
+    Seed 15 comments on test_post in one executemany for the
+    pagination tests. Function-scoped: rows live inside the per-test
+    transaction and roll back with it.
+    """
+    db.bulk_insert_mappings(Comment, [
+        {
+            "content": f"Test Comment {i}",
+            "post_id": test_post.id,
+            "author_id": test_user.id,
+            "created_at": _NOW
+        }
+        for i in range(15)
+    ])
     db.commit()
 
+
+def test_get_comments_pagination(client, test_post, many_comments):
+    """Test comment pagination"""
     # Test with default pagination
     response = client.get(
         f"{settings.API_V1_STR}/comments/post/{test_post.id}")
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.json()) == 10  # Default limit
+    page = response.json()
+    assert len(page["items"]) == 10  # Default limit
+    assert page["next_cursor"] == page["items"][-1]["id"]
 
-    # Test with custom pagination
+    # Test following the cursor
     response = client.get(
-        f"{settings.API_V1_STR}/comments/post/{test_post.id}?skip=10&limit=5"
+        f"{settings.API_V1_STR}/comments/post/{test_post.id}"
+        f"?after_id={page['next_cursor']}&limit=5"
     )
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.json()) == 5
+    page = response.json()
+    assert len(page["items"]) == 5
+    ids = [comment["id"] for comment in page["items"]]
+    assert ids == sorted(ids)
 
 
 def test_update_comment(authorized_client, test_comment):
@@ -207,29 +210,23 @@ def test_delete_comment_unauthorized(client, test_comment):
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-def test_comment_by_different_role_users(
-    client, db, test_post, test_users
-):
-    """Test comment operations with different user roles"""
-    # Login as different users and test commenting
-    for role, user in test_users.items():
-        # Login
-        response = client.post(
-            f"{settings.API_V1_STR}/auth/login",
-            data={"username": user.email, "password": f"{role}pass"}
-        )
-        assert response.status_code == status.HTTP_200_OK
-        token = response.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
-
-        # Try to create a comment
+@pytest.mark.parametrize("role", ["admin", "author", "reader"])
+def test_comment_by_different_role_users(client, test_post, test_users, role):
+    """Test comment creation with different user roles"""
+    # What's under test is the role check, not the auth stack (that has
+    # its own coverage in test_auth); stubbing get_current_user skips
+    # the JWT sign/verify and Redis round-trips per parametrized case.
+    user = test_users[role]
+    app.dependency_overrides[get_current_user] = lambda: user
+    try:
         comment_data = {
             "content": f"Comment by {role}",
             "post_id": test_post.id
         }
         response = client.post(
             f"{settings.API_V1_STR}/comments/",
-            json=comment_data,
-            headers=headers
+            json=comment_data
         )
         assert response.status_code == status.HTTP_200_OK
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
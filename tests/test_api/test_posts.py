@@ -1,11 +1,16 @@
 import pytest
 from datetime import datetime
 from fastapi import status
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from app.core.config import settings
 from app.models.post import Post, Tag
 from app.models.user import User, UserRole
 
+# One timestamp for all seeded rows; nothing here depends on rows
+# having distinct clock values.
+_NOW = datetime.utcnow()
+
 
 @pytest.fixture
 def test_tags(db: Session):
@@ -18,25 +23,24 @@ def test_tags(db: Session):
     for tag in tags:
         db.add(tag)
     db.commit()
-    for tag in tags:
-        db.refresh(tag)
     return tags
 
 
 @pytest.fixture
-def test_post(db: Session, test_author: User, test_tags: list[Tag]):
-    """Create a test post"""
+def test_post_with_tags(db: Session, test_author: User, test_tags: list[Tag]):
+    """Create a test post carrying the first two test tags"""
+    # Tests that don't assert on tags use the shared untagged
+    # test_post fixture from conftest instead.
     post = Post(
         title="Test Post",
         content="Test Content",
         author_id=test_author.id,
         tags=test_tags[:2],  # Add first two tags
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
+        created_at=_NOW,
+        updated_at=_NOW
     )
     db.add(post)
     db.commit()
-    db.refresh(post)
     return post
 
 
@@ -101,6 +105,7 @@ def test_create_post_reader(authorized_client):
     assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
+@pytest.mark.max_queries(30)
 def test_get_posts(client, db, test_author, test_tags):
     """Test getting all posts"""
     # Create test posts
@@ -111,18 +116,16 @@ def test_get_posts(client, db, test_author, test_tags):
             content=f"Content {i}",
             author_id=test_author.id,
             tags=test_tags[:2],
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_at=_NOW,
+            updated_at=_NOW
         )
         db.add(post)
         posts.append(post)
     db.commit()
-    for post in posts:
-        db.refresh(post)
 
     response = client.get(f"{settings.API_V1_STR}/posts/")
     assert response.status_code == status.HTTP_200_OK
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 3
     for post_data in data:
         assert "title" in post_data
@@ -131,40 +134,150 @@ def test_get_posts(client, db, test_author, test_tags):
         assert "tags" in post_data
 
 
-def test_get_posts_pagination(client, db, test_author):
-    """Test post pagination"""
-    # Create multiple posts
-    for i in range(15):
-        post = Post(
-            title=f"Test Post {i}",
-            content=f"Content {i}",
-            author_id=test_author.id,
-            tags=[],
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        )
-        db.add(post)
+@pytest.fixture
+def many_posts(db: Session, test_author: User):
+    """
+    Seed 15 untagged posts in one executemany for the pagination
+    tests. Function-scoped: rows live inside the per-test transaction
+    and roll back with it, so a wider scope would not survive anyway.
+    """
+    db.bulk_insert_mappings(Post, [
+        {
+            "title": f"Test Post {i}",
+            "content": f"Content {i}",
+            "author_id": test_author.id,
+            "created_at": _NOW,
+            "updated_at": _NOW
+        }
+        for i in range(15)
+    ])
     db.commit()
 
+
+def test_get_posts_pagination(client, many_posts):
+    """Test post pagination"""
     # Test default pagination
     response = client.get(f"{settings.API_V1_STR}/posts/")
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.json()) == 10  # Default limit
+    page = response.json()
+    assert len(page["items"]) == 10  # Default limit
+    assert page["next_cursor"] == page["items"][-1]["id"]
+
+    # Test following the cursor
+    response = client.get(
+        f"{settings.API_V1_STR}/posts/"
+        f"?after_id={page['next_cursor']}&limit=5"
+    )
+    assert response.status_code == status.HTTP_200_OK
+    page = response.json()
+    assert len(page["items"]) == 5
+    ids = [post["id"] for post in page["items"]]
+    assert ids == sorted(ids, reverse=True)
+
+
+def test_get_posts_total_count_cached(client, db, many_posts):
+    """Test that pages of one listing share a single cached COUNT"""
+    count_statements = []
+
+    def track(conn, cursor, statement, parameters, context, executemany):
+        if statement.lower().startswith("select count"):
+            count_statements.append(statement)
+
+    connection = db.connection()
+    event.listen(connection, "before_cursor_execute", track)
+    try:
+        page = client.get(f"{settings.API_V1_STR}/posts/").json()
+        assert page["total"] == 15
+
+        # A different cursor misses the response cache but must reuse
+        # the cached total instead of re-counting.
+        page = client.get(
+            f"{settings.API_V1_STR}/posts/?after_id={page['next_cursor']}"
+        ).json()
+        assert page["total"] == 15
+    finally:
+        event.remove(connection, "before_cursor_execute", track)
+
+    assert len(count_statements) == 1
+
+
+def test_get_posts_repeated_request_served_from_cache(client, many_posts):
+    """Test that an identical listing request hits the response cache"""
+    # Same URL both times: the second response must come from Redis,
+    # which exercises the backend's decode path, not just misses. The
+    # header is the proof — equal bodies alone would also pass on two
+    # misses.
+    url = f"{settings.API_V1_STR}/posts/"
+    first = client.get(url)
+    assert first.status_code == status.HTTP_200_OK
+    assert first.headers["X-FastAPI-Cache"] == "MISS"
+
+    second = client.get(url)
+    assert second.status_code == status.HTTP_200_OK
+    assert second.headers["X-FastAPI-Cache"] == "HIT"
+    assert second.json() == first.json()
+
+
+def test_get_post_repeated_request_served_from_cache(client, test_post_with_tags):
+    """Test that an identical detail request hits the response cache"""
+    url = f"{settings.API_V1_STR}/posts/{test_post_with_tags.id}"
+    first = client.get(url)
+    assert first.status_code == status.HTTP_200_OK
+    assert first.headers["X-FastAPI-Cache"] == "MISS"
+
+    second = client.get(url)
+    assert second.status_code == status.HTTP_200_OK
+    assert second.headers["X-FastAPI-Cache"] == "HIT"
+    assert second.json() == first.json()
+
+
+def test_post_list_cache_invalidated_on_create(author_client, many_posts):
+    """Test that creating a post drops the cached listing"""
+    url = f"{settings.API_V1_STR}/posts/"
+    # Prime the response cache, then write
+    assert author_client.get(url).status_code == status.HTTP_200_OK
+
+    response = author_client.post(
+        url,
+        json={"title": "Fresh Post", "content": "Fresh Content", "tags": []}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    created_id = response.json()["id"]
+
+    # The same listing URL must serve fresh items, not the 60s-TTL
+    # entry (the COUNT total is allowed to lag; the items are not).
+    page = author_client.get(url).json()
+    assert any(post["id"] == created_id for post in page["items"])
 
-    # Test custom pagination
-    response = client.get(f"{settings.API_V1_STR}/posts/?skip=10&limit=5")
+
+def test_post_detail_cache_invalidated_on_update(author_client, test_post):
+    """Test that updating a post drops the cached detail"""
+    url = f"{settings.API_V1_STR}/posts/{test_post.id}"
+    # Prime the response cache, then write
+    assert author_client.get(url).json()["title"] == "Test Post"
+
+    response = author_client.put(
+        url,
+        json={
+            "title": "Updated Title",
+            "content": "Updated Content",
+            "tags": []
+        }
+    )
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.json()) == 5
 
+    assert author_client.get(url).json()["title"] == "Updated Title"
 
-def test_get_post_by_id(client, test_post):
+
+def test_get_post_by_id(client, test_post_with_tags):
     """Test getting a single post by ID"""
-    response = client.get(f"{settings.API_V1_STR}/posts/{test_post.id}")
+    response = client.get(
+        f"{settings.API_V1_STR}/posts/{test_post_with_tags.id}")
 
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
-    assert data["title"] == test_post.title
-    assert data["content"] == test_post.content
+    assert data["title"] == test_post_with_tags.title
+    assert data["content"] == test_post_with_tags.content
     assert len(data["tags"]) == 2
 
 
@@ -244,7 +357,7 @@ def test_delete_post_not_found(author_client):
 
 def test_get_posts_with_filters(client, db, test_author, test_tags):
     """Test getting posts with various filters"""
-    now = datetime.utcnow()
+    now = _NOW
 
     # Create posts with different dates and tags
     posts = [
@@ -272,14 +385,14 @@ def test_get_posts_with_filters(client, db, test_author, test_tags):
     # Test keyword filter
     response = client.get(f"{settings.API_V1_STR}/posts/?keyword=python")
     assert response.status_code == status.HTTP_200_OK
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 1
     assert "Python" in data[0]["title"]
 
     # Test tag filter
     response = client.get(f"{settings.API_V1_STR}/posts/?tag=fastapi")
     assert response.status_code == status.HTTP_200_OK
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 1
     assert "FastAPI" in data[0]["title"]
 
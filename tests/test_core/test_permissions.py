@@ -11,40 +11,55 @@ from app.schemas.user import User as UserSchema
 from app.models.post import Post as PostModel
 
 
+def _user(role: UserRole, user_id: int = 1) -> UserSchema:
+    """
+    Build a throwaway user for a single check. model_construct skips
+    pydantic validation, which these trusted literal inputs don't need.
+    """
+    return UserSchema.model_construct(
+        id=user_id,
+        email=f"{role.value}@test.com",
+        role=role,
+        is_active=True,
+        full_name=role.value.title()
+    )
+
+
+@pytest.fixture(scope="session")
+def _mock_users():
+    """
+    Run pydantic validation once per role for the whole session; the
+    per-test fixtures below hand out shallow copies so tests that flip
+    is_active can't leak state into each other.
+    """
+    return {
+        role: UserSchema(
+            id=i,
+            email=f"{role.value}@example.com",
+            full_name=f"Test {role.value.title()}",
+            role=role,
+            is_active=True
+        )
+        for i, role in enumerate(UserRole, start=1)
+    }
+
+
 @pytest.fixture
-def mock_reader():
+def mock_reader(_mock_users):
     """Create a mock reader user"""
-    return UserSchema(
-        id=1,
-        email="reader@example.com",
-        full_name="Test Reader",
-        role=UserRole.READER,
-        is_active=True
-    )
+    return _mock_users[UserRole.READER].model_copy()
 
 
 @pytest.fixture
-def mock_author():
+def mock_author(_mock_users):
     """Create a mock author user"""
-    return UserSchema(
-        id=2,
-        email="author@example.com",
-        full_name="Test Author",
-        role=UserRole.AUTHOR,
-        is_active=True
-    )
+    return _mock_users[UserRole.AUTHOR].model_copy()
 
 
 @pytest.fixture
-def mock_admin():
+def mock_admin(_mock_users):
     """Create a mock admin user"""
-    return UserSchema(
-        id=3,
-        email="admin@example.com",
-        full_name="Test Admin",
-        role=UserRole.ADMIN,
-        is_active=True
-    )
+    return _mock_users[UserRole.ADMIN].model_copy()
 
 
 def test_admin_permissions(mock_admin):
@@ -105,24 +120,12 @@ async def test_require_permission_decorator():
         return {"message": "success"}
 
     # Test with admin user (should succeed)
-    admin = UserSchema(
-        id=1,
-        email="admin@test.com",
-        role=UserRole.ADMIN,
-        is_active=True,
-        full_name="Admin"
-    )
+    admin = _user(UserRole.ADMIN)
     result = await test_endpoint(current_user=admin)
     assert result == {"message": "success"}
 
     # Test with reader user (should raise HTTPException)
-    reader = UserSchema(
-        id=2,
-        email="reader@test.com",
-        role=UserRole.READER,
-        is_active=True,
-        full_name="Reader"
-    )
+    reader = _user(UserRole.READER, user_id=2)
     with pytest.raises(HTTPException) as exc_info:
         await test_endpoint(current_user=reader)
     assert exc_info.value.status_code == 403
@@ -168,13 +171,7 @@ async def test_permission_decorator_with_resource():
         return {"message": "success"}
 
     # Test with author editing own post
-    author = UserSchema(
-        id=1,
-        email="author@test.com",
-        role=UserRole.AUTHOR,
-        is_active=True,
-        full_name="Author"
-    )
+    author = _user(UserRole.AUTHOR)
     result = await edit_post(current_user=author, post_id=1)
     assert result == {"message": "success"}
 
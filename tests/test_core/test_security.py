@@ -1,24 +1,42 @@
 import pytest
 from datetime import datetime, timedelta
 from datetime import timezone
-from jose import jwt, JWTError
+from unittest import mock
+import jwt
+from jwt import PyJWTError
 from app.core.security import (
     create_access_token,
     verify_token,
     get_password_hash,
     verify_password,
     invalidate_token,
-    is_token_valid
+    is_token_valid,
+    pwd_context
 )
 from app.core.config import settings
-from app.core.token_blacklist import token_blacklist
+from app.core.token_blacklist import BLACKLIST_KEY_PREFIX, token_blacklist
 
 
 @pytest.fixture(autouse=True)
 def clear_redis():
-    """Clear Redis after each test"""
+    """Drop blacklist entries after each test"""
+    # FLUSHDB is O(all keys) and clobbers anything else in the DB;
+    # only the keys these tests create need to go, and UNLINK frees
+    # them off the server's main thread.
     yield
-    token_blacklist.redis_client.flushdb()
+    client = token_blacklist.redis_client
+    for key in client.scan_iter(match=f"{BLACKLIST_KEY_PREFIX}*", count=500):
+        client.unlink(key)
+
+
+@pytest.fixture(scope="session")
+def known_password_hash():
+    """
+    One bcrypt hash of "testpassword123" shared by every test that
+    only verifies against it; the KDF is deliberately slow, so each
+    avoided call is a real chunk of suite wallclock.
+    """
+    return get_password_hash("testpassword123")
 
 
 def test_create_access_token():
@@ -71,13 +89,13 @@ def test_verify_token_expired():
         expires_delta=timedelta(minutes=-1)
     )
 
-    with pytest.raises(JWTError):
+    with pytest.raises(PyJWTError):
         verify_token(token)
 
 
 def test_verify_token_invalid():
     """Test verification of invalid token"""
-    with pytest.raises(JWTError):
+    with pytest.raises(PyJWTError):
         verify_token("invalid_token")
 
 
@@ -86,21 +104,20 @@ def test_verify_token_blacklisted():
     token = create_access_token(subject="test@example.com")
     invalidate_token(token)
 
-    with pytest.raises(JWTError):
+    with pytest.raises(PyJWTError):
         verify_token(token)
 
 
-def test_password_hashing():
+def test_password_hashing(known_password_hash):
     """Test password hashing functionality"""
     password = "testpassword123"
-    hashed = get_password_hash(password)
 
     # Verify hash is different from password
-    assert hashed != password
+    assert known_password_hash != password
     # Verify password verification works
-    assert verify_password(password, hashed) is True
+    assert verify_password(password, known_password_hash) is True
     # Verify wrong password fails
-    assert verify_password("wrongpassword", hashed) is False
+    assert verify_password("wrongpassword", known_password_hash) is False
 
 
 def test_password_hash_none():
@@ -153,6 +170,49 @@ def test_is_token_valid():
     assert is_token_valid(token) is False
 
 
+def test_invalidate_token_wrong_signature():
+    """Test that a token signed with the wrong key cannot be blacklisted"""
+    # Logout is unauthenticated, so blacklisting must verify the
+    # signature itself; a forged token must not write a Redis key.
+    forged = jwt.encode(
+        {
+            "sub": "test@example.com",
+            "exp": datetime.now(tz=timezone.utc) + timedelta(days=365)
+        },
+        "not-the-real-signing-secret-of-this-app",
+        algorithm=settings.ALGORITHM
+    )
+    with pytest.raises(ValueError):
+        invalidate_token(forged)
+    assert not token_blacklist.redis_client.exists(
+        f"{BLACKLIST_KEY_PREFIX}{forged}")
+
+
+def test_blacklist_ttl_clamped():
+    """Test that a blacklist entry never outlives the token lifetime"""
+    token = create_access_token(
+        subject="test@example.com",
+        expires_delta=timedelta(days=365)
+    )
+    invalidate_token(token)
+
+    ttl = token_blacklist.redis_client.ttl(f"{BLACKLIST_KEY_PREFIX}{token}")
+    assert 0 < ttl <= settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+
+def test_blacklist_token_without_exp():
+    """Test blacklisting a valid token that carries no exp claim"""
+    token = jwt.encode(
+        {"sub": "test@example.com"},
+        settings.SECRET_KEY,
+        algorithm=settings.ALGORITHM
+    )
+    invalidate_token(token)
+
+    ttl = token_blacklist.redis_client.ttl(f"{BLACKLIST_KEY_PREFIX}{token}")
+    assert 0 < ttl <= settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+
 def test_token_expiry_calculation():
     """Test token expiry time calculation"""
     expires_delta = timedelta(minutes=30)
@@ -170,20 +230,20 @@ def test_token_expiry_calculation():
     assert abs((exp_time - now - expires_delta).total_seconds()) < 5
 
 
-def test_password_verification_timing():
-    """Test that password verification timing is consistent"""
-    password = "testpassword123"
-    hashed = get_password_hash(password)
-
-    # Time verification of correct password
-    start = datetime.now(tz=timezone.utc)
-    verify_password(password, hashed)
-    correct_time = (datetime.now(tz=timezone.utc) - start).total_seconds()
-
-    # Time verification of wrong password
-    start = datetime.now(tz=timezone.utc)
-    verify_password("wrongpassword", hashed)
-    wrong_time = (datetime.now(tz=timezone.utc) - start).total_seconds()
-
-    # Verification times should be similar (within 100ms)
-    assert abs(correct_time - wrong_time) < 0.1
+def test_password_verification_no_short_circuit(known_password_hash):
+    """Test that wrong passwords still go through the full KDF"""
+    # Wall-clock comparison of two bcrypt runs was slow and flaky;
+    # bcrypt itself is constant-time by construction, so what needs
+    # asserting is that verify_password never short-circuits before
+    # handing both arguments to the KDF.
+    with mock.patch.object(
+        pwd_context, "verify", wraps=pwd_context.verify
+    ) as verify_spy:
+        assert verify_password("testpassword123", known_password_hash) is True
+        assert verify_password("wrongpassword", known_password_hash) is False
+
+    assert verify_spy.call_count == 2
+    assert all(
+        call.args[1] == known_password_hash
+        for call in verify_spy.call_args_list
+    )